@@ -127,6 +127,24 @@ class TestComputeLineDiff:
         final = apply_hunk_decisions(annotated, decisions)
         assert final == proposed
 
+    def test_shared_prefix_and_suffix_round_trip(self):
+        """Test that edits between a long shared head and tail round-trip exactly."""
+        head = "".join(f"head {i}\n" for i in range(50))
+        tail = "".join(f"tail {i}\n" for i in range(50))
+        original = head + "old\n" + tail
+        proposed = head + "new\nextra\n" + tail
+        result = compute_line_diff(original, proposed, truncate_unchanged=False)
+
+        assert [h.kind for h in result] == ["unchanged", "modified", "unchanged"]
+        assert result[0].original == head
+        assert result[2].original == tail
+
+        annotated = annotate_hunks_with_ids(result)
+        accepted = {h.id: HunkDecision(status="accepted") for h in annotated}
+        rejected = {h.id: HunkDecision(status="rejected") for h in annotated}
+        assert apply_hunk_decisions(annotated, accepted) == proposed
+        assert apply_hunk_decisions(annotated, rejected) == original
+
 
 class TestAnnotateHunksWithIds:
     """Tests for annotate_hunks_with_ids function."""
@@ -5,6 +5,8 @@ Tests render_note_edit_diff_dom, render_note_edit_success_dom,
 render_note_edit_discarded_dom, and render_note_edit_error_dom.
 """
 
+import json
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -13,6 +15,7 @@ from toolbridge_mcp.ui.remote_dom.note_edits import (
     render_note_edit_success_dom,
     render_note_edit_discarded_dom,
     render_note_edit_error_dom,
+    render_note_edit_discarded_dom_json,
     _render_hunk_block,
     _render_diff_content,
     _render_diff_line,
@@ -497,6 +500,19 @@ class TestRenderNoteEditDiscardedDom:
         result_str = str(result)
         assert "My Important Note" in result_str
 
+    def test_json_memoized_per_title(self):
+        """Test that repeated renders for the same title reuse the cached JSON."""
+        first = render_note_edit_discarded_dom_json("Cached Note")
+
+        assert render_note_edit_discarded_dom_json("Cached Note") is first
+        assert render_note_edit_discarded_dom_json("Other Note") is not first
+
+    def test_json_variant_matches_tree(self):
+        """Test that the serialized variant encodes the same tree."""
+        result = render_note_edit_discarded_dom_json("Test Note")
+
+        assert json.loads(result) == render_note_edit_discarded_dom("Test Note")
+
 
 class TestRenderNoteEditErrorDom:
     """Tests for render_note_edit_error_dom function."""
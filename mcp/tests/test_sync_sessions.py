@@ -0,0 +1,264 @@
+"""
+Unit tests for Go API sync session caching and stale-session retries.
+
+Tests create_session's per-user cache (utils/session.py) and the retry in
+_send (utils/requests.py) when the Go API rejects a cached session.
+"""
+
+import base64
+import json
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from toolbridge_mcp.utils import requests as api_requests
+from toolbridge_mcp.utils import session as sync_session
+from toolbridge_mcp.utils.session import (
+    SESSION_TTL_SECONDS,
+    _session_cache,
+    create_session,
+    invalidate_session,
+)
+
+
+def make_backend_jwt(sub: str) -> str:
+    """Build an unsigned JWT whose payload carries the given sub claim."""
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": sub}).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload.decode()}.sig"
+
+
+class FakeGoAPI:
+    """MockTransport handler that hands out sessions and replays queued API responses."""
+
+    def __init__(self, *api_responses: httpx.Response):
+        self.session_posts = 0
+        self.api_calls = []
+        self._api_responses = list(api_responses)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/sync/sessions":
+            self.session_posts += 1
+            return httpx.Response(201, json={"id": f"sess-{self.session_posts}", "epoch": 1})
+
+        self.api_calls.append(request)
+        if self._api_responses:
+            return self._api_responses.pop(0)
+        return httpx.Response(200, json={"ok": True})
+
+
+def make_client(api: FakeGoAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(api), base_url="http://go-api")
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache():
+    """Clear cached sync sessions before and after each test."""
+    _session_cache.clear()
+    api_requests._request_headers.set(None)
+    yield
+    _session_cache.clear()
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the session module's monotonic clock with a settable one."""
+    clock = MagicMock(return_value=1000.0)
+    monkeypatch.setattr(sync_session.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def backend_auth(monkeypatch):
+    """Stub MCP auth so _send only talks to the fake Go API."""
+    # The backend JWT's sub deliberately differs from the validated MCP sub
+    auth_header = f"Bearer {make_backend_jwt('backend-sub')}"
+
+    async def resolved(client):
+        return "tenant-1"
+
+    async def backend_header(client):
+        return auth_header
+
+    access_token = MagicMock(token="mcp-token", claims={"sub": "user-1"})
+    monkeypatch.setattr(api_requests, "get_access_token", lambda: access_token)
+    monkeypatch.setattr(api_requests, "ensure_tenant_resolved", resolved)
+    monkeypatch.setattr(api_requests, "get_backend_auth_header", backend_header)
+    return auth_header
+
+
+class TestCreateSessionCache:
+    """Tests for the per-user sync session cache."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_cached_session(self):
+        """Test that a second call for the same user does not POST again."""
+        api = FakeGoAPI()
+        async with make_client(api) as client:
+            first = await create_session(client, "Bearer t", "user-1")
+            second = await create_session(client, "Bearer t", "user-1")
+
+        assert api.session_posts == 1
+        assert second is first
+        assert first["X-Sync-Session"] == "sess-1"
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_per_user(self):
+        """Test that different users get different sessions."""
+        api = FakeGoAPI()
+        async with make_client(api) as client:
+            first = await create_session(client, "Bearer a", "user-a")
+            second = await create_session(client, "Bearer b", "user-b")
+
+        assert api.session_posts == 2
+        assert first["X-Sync-Session"] != second["X-Sync-Session"]
+
+    @pytest.mark.asyncio
+    async def test_expired_session_is_recreated(self, fake_clock):
+        """Test that a session older than the TTL triggers a new POST."""
+        api = FakeGoAPI()
+        async with make_client(api) as client:
+            await create_session(client, "Bearer t", "user-1")
+            fake_clock.return_value += SESSION_TTL_SECONDS + 1
+            refreshed = await create_session(client, "Bearer t", "user-1")
+
+        assert api.session_posts == 2
+        assert refreshed["X-Sync-Session"] == "sess-2"
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_never_cached(self):
+        """Test that sessions for unidentified users always POST."""
+        api = FakeGoAPI()
+        async with make_client(api) as client:
+            await create_session(client, "Bearer t", "unknown")
+            await create_session(client, "Bearer t", "unknown")
+
+        assert api.session_posts == 2
+        assert "unknown" not in _session_cache
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_new_session(self):
+        """Test that invalidate_session drops the cached entry."""
+        api = FakeGoAPI()
+        async with make_client(api) as client:
+            await create_session(client, "Bearer t", "user-1")
+            invalidate_session("user-1")
+            await create_session(client, "Bearer t", "user-1")
+
+        assert api.session_posts == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_headers_are_read_only(self):
+        """Test that callers cannot mutate the shared cached headers."""
+        async with make_client(FakeGoAPI()) as client:
+            headers = await create_session(client, "Bearer t", "user-1")
+
+        with pytest.raises(TypeError):
+            headers["X-Sync-Session"] = "other"
+
+    @pytest.mark.asyncio
+    async def test_insert_prunes_expired_entries(self, fake_clock):
+        """Test that storing a session drops other users' expired sessions."""
+        async with make_client(FakeGoAPI()) as client:
+            await create_session(client, "Bearer a", "user-a")
+            fake_clock.return_value += SESSION_TTL_SECONDS + 1
+            await create_session(client, "Bearer b", "user-b")
+
+        assert list(_session_cache) == ["user-b"]
+
+    @pytest.mark.asyncio
+    async def test_evicts_oldest_when_full(self, monkeypatch):
+        """Test that the cache never grows past SESSION_CACHE_MAXSIZE."""
+        monkeypatch.setattr(sync_session, "SESSION_CACHE_MAXSIZE", 2)
+        async with make_client(FakeGoAPI()) as client:
+            for user_id in ("user-a", "user-b", "user-c"):
+                await create_session(client, "Bearer t", user_id)
+
+        assert list(_session_cache) == ["user-b", "user-c"]
+
+
+class TestSessionCacheKey:
+    """Tests for which user ID keys the sync session cache."""
+
+    @pytest.mark.asyncio
+    async def test_keyed_on_validated_mcp_sub(self, backend_auth):
+        """Test that the cache uses the MCP token's sub, not the backend JWT's."""
+        async with make_client(FakeGoAPI()) as client:
+            await api_requests.call_get(client, "/v1/notes")
+
+        assert list(_session_cache) == ["user-1"]
+
+    @pytest.mark.asyncio
+    async def test_missing_sub_is_not_cached(self, backend_auth, monkeypatch):
+        """Test that requests without a validated sub never share a session."""
+        access_token = MagicMock(token="mcp-token", claims={})
+        monkeypatch.setattr(api_requests, "get_access_token", lambda: access_token)
+        api = FakeGoAPI()
+        async with make_client(api) as client:
+            await api_requests.call_get(client, "/v1/notes")
+
+        assert api.session_posts == 1
+        assert not _session_cache
+
+
+class TestStaleSessionRetry:
+    """Tests for _send retrying once when the Go API rejects the session."""
+
+    @pytest.mark.asyncio
+    async def test_retries_on_session_required(self, backend_auth):
+        """Test that a 428 drops the cached session and retries with a new one."""
+        api = FakeGoAPI(httpx.Response(428, json={"error": "session_required"}))
+        async with make_client(api) as client:
+            response = await api_requests.call_get(client, "/v1/notes")
+
+        assert response.status_code == 200
+        assert api.session_posts == 2
+        assert [r.headers["X-Sync-Session"] for r in api.api_calls] == ["sess-1", "sess-2"]
+
+    @pytest.mark.asyncio
+    async def test_retries_on_epoch_mismatch(self, backend_auth):
+        """Test that a 409 epoch_mismatch retries with a new session."""
+        api = FakeGoAPI(httpx.Response(409, json={"error": "epoch_mismatch"}))
+        async with make_client(api) as client:
+            response = await api_requests.call_get(client, "/v1/notes")
+
+        assert response.status_code == 200
+        assert api.session_posts == 2
+        assert len(api.api_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_version_conflict_is_not_retried(self, backend_auth):
+        """Test that other 409s reach the caller without a retry."""
+        api = FakeGoAPI(httpx.Response(409, json={"error": "version_mismatch"}))
+        async with make_client(api) as client:
+            with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                await api_requests.call_put(client, "/v1/notes/n1", json={}, if_match=3)
+
+        assert exc_info.value.response.status_code == 409
+        assert api.session_posts == 1
+        assert len(api.api_calls) == 1
+        assert "user-1" in _session_cache
+
+    @pytest.mark.asyncio
+    async def test_non_object_conflict_body_is_not_retried(self, backend_auth):
+        """Test that a 409 with a non-object JSON body is treated as a conflict."""
+        api = FakeGoAPI(httpx.Response(409, json=["epoch_mismatch"]))
+        async with make_client(api) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await api_requests.call_get(client, "/v1/notes")
+
+        assert len(api.api_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_only_once(self, backend_auth):
+        """Test that a second stale-session response is raised, not retried."""
+        api = FakeGoAPI(
+            httpx.Response(428, json={"error": "session_required"}),
+            httpx.Response(428, json={"error": "session_required"}),
+        )
+        async with make_client(api) as client:
+            with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                await api_requests.call_get(client, "/v1/notes")
+
+        assert exc_info.value.response.status_code == 428
+        assert len(api.api_calls) == 2
@@ -292,6 +292,21 @@ class TestBuildUIWithTextAndDom:
         assert len(parsed["children"]) == 1
         assert parsed["children"][0]["props"]["text"] == "Hello World"
 
+    def test_remote_dom_accepts_pre_serialized_json(self):
+        """Test that a pre-serialized Remote DOM string is passed through unchanged."""
+        from toolbridge_mcp.ui.resources import build_ui_with_text_and_dom, UIFormat
+
+        dom_json = '{"type":"text","props":{"text":"Cached"}}'
+        result = build_ui_with_text_and_dom(
+            uri="ui://test/pre-serialized",
+            html=None,
+            remote_dom=dom_json,
+            text_summary="Pre-serialized test",
+            ui_format=UIFormat.REMOTE_DOM,
+        )
+
+        assert result[1].resource.text == dom_json
+
     def test_uri_preserved_in_remote_dom_resource(self):
         """Test that URI is correctly set in Remote DOM resource."""
         from toolbridge_mcp.ui.resources import build_ui_with_text_and_dom, UIFormat
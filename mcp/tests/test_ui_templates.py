@@ -149,6 +149,16 @@ class TestNotesTemplates:
         assert "<img src=x" not in html
         assert escape(xss_content) in html
 
+    def test_esc_matches_html_escape(self):
+        """Test that the fast-path escaper matches html.escape output."""
+        from toolbridge_mcp.ui.templates._html import esc
+
+        clean = "plain title"
+        assert esc(clean) is clean
+        assert esc("") == ""
+        for raw in ["a & b", "<b>", "\"quoted\"", "it's"]:
+            assert esc(raw) == escape(raw)
+
 
 class TestTasksTemplates:
     """Test suite for tasks HTML templates."""
@@ -13,6 +13,9 @@ This module enables per-user authentication flow:
 - Backend API validates backend JWT and creates per-user session
 """
 
+import base64
+import json
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timedelta
 
@@ -175,6 +178,7 @@ def issue_backend_jwt(
         raise TokenExchangeError(f"Failed to sign backend JWT: {e}")
 
 
+@lru_cache(maxsize=1024)
 def _unsafe_extract_user_id_for_logging(backend_jwt: str) -> str:
     """
     WARNING: Logging-only helper - DO NOT use for authorization decisions.
@@ -192,12 +196,25 @@ def _unsafe_extract_user_id_for_logging(backend_jwt: str) -> str:
     If you need to make authorization decisions based on JWT claims, you MUST
     use a validated token from the backend API or implement proper validation.
 
+    Results are memoized per token string. The same backend JWT is reused
+    (via the per-user JWT cache) for every API call until it expires, so this
+    skips the base64 + JSON decode on all but the first call.
+
     Args:
         backend_jwt: Backend JWT token string (trusted source only)
 
     Returns:
         User ID (sub claim) or "unknown" if extraction fails
     """
+    # Fast path: read the payload segment directly. Nothing is verified either
+    # way, so python-jose's header parsing and option handling is pure overhead
+    try:
+        payload_b64 = backend_jwt.split(".", 2)[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4)))
+        return claims.get("sub", "unknown")
+    except Exception:
+        pass  # Fall through to python-jose for malformed tokens
+
     try:
         # python-jose requires a key parameter even when not verifying signature
         # All validation is disabled - this is intentional for logging-only use
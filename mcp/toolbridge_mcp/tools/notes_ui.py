@@ -501,7 +501,7 @@ async def apply_note_edit(
         if ui_format in ("html", "both"):
             html = note_edits_templates.render_note_edit_error_html(error_msg, note_uid)
         if ui_format in ("remote-dom", "both"):
-            remote_dom = note_edits_dom.render_note_edit_error_dom(error_msg, note_uid)
+            remote_dom = note_edits_dom.render_note_edit_error_dom_json(error_msg, note_uid)
         return build_ui_with_text_and_dom(
             uri=uri,
             html=html,
@@ -696,13 +696,13 @@ async def discard_note_edit(
 
     # Build confirmation UI
     html: str | None = None
-    remote_dom: dict | None = None
+    remote_dom: str | None = None
 
     if ui_format in ("html", "both"):
         html = note_edits_templates.render_note_edit_discarded_html(title)
 
     if ui_format in ("remote-dom", "both"):
-        remote_dom = note_edits_dom.render_note_edit_discarded_dom(title)
+        remote_dom = note_edits_dom.render_note_edit_discarded_dom_json(title)
 
     ui_uri = f"ui://toolbridge/notes/edit/{edit_id}/discarded"
 
@@ -756,7 +756,7 @@ async def accept_note_edit_hunk(
         if ui_format in ("html", "both"):
             html = note_edits_templates.render_note_edit_error_html(error_msg)
         if ui_format in ("remote-dom", "both"):
-            remote_dom = note_edits_dom.render_note_edit_error_dom(error_msg)
+            remote_dom = note_edits_dom.render_note_edit_error_dom_json(error_msg)
 
         return build_ui_with_text_and_dom(
             uri=f"ui://toolbridge/notes/edit/{edit_id}/error",
@@ -854,7 +854,7 @@ async def reject_note_edit_hunk(
         if ui_format in ("html", "both"):
             html = note_edits_templates.render_note_edit_error_html(error_msg)
         if ui_format in ("remote-dom", "both"):
-            remote_dom = note_edits_dom.render_note_edit_error_dom(error_msg)
+            remote_dom = note_edits_dom.render_note_edit_error_dom_json(error_msg)
 
         return build_ui_with_text_and_dom(
             uri=f"ui://toolbridge/notes/edit/{edit_id}/error",
@@ -955,7 +955,7 @@ async def revise_note_edit_hunk(
         if ui_format in ("html", "both"):
             html = note_edits_templates.render_note_edit_error_html(error_msg)
         if ui_format in ("remote-dom", "both"):
-            remote_dom = note_edits_dom.render_note_edit_error_dom(error_msg)
+            remote_dom = note_edits_dom.render_note_edit_error_dom_json(error_msg)
 
         return build_ui_with_text_and_dom(
             uri=f"ui://toolbridge/notes/edit/{edit_id}/error",
@@ -4,6 +4,8 @@ Builds Remote DOM tree structures for diff preview rendering via RemoteDomView.
 Uses design tokens for consistent styling with native ToolBridge UI.
 """
 
+import json
+from functools import lru_cache
 from typing import Dict, Any, List, TYPE_CHECKING
 
 from toolbridge_mcp.ui.remote_dom.design import (
@@ -19,7 +21,6 @@ from toolbridge_mcp.ui.remote_dom.design import (
 
 if TYPE_CHECKING:
     from toolbridge_mcp.tools.notes import Note
-    from toolbridge_mcp.utils.diff import DiffHunk
     from toolbridge_mcp.note_edit_sessions import NoteEditHunkState
 
 
@@ -38,6 +39,44 @@ STATUS_BORDER = {
     "revised": "#58a6ff",   # Blue
 }
 
+# Root column props shared by the note edit DOMs. They are never mutated after
+# construction, so one instance per layout is reused across renders.
+_ROOT_PROPS_DETAIL: Dict[str, Any] = {
+    "gap": Spacing.SECTION_GAP,
+    "padding": 24,
+    "fullWidth": True,
+    "crossAxisAlignment": "stretch",
+}
+if Layout.MAX_WIDTH_DETAIL is not None:
+    _ROOT_PROPS_DETAIL["maxWidth"] = Layout.MAX_WIDTH_DETAIL
+
+_ROOT_PROPS_MESSAGE: Dict[str, Any] = {
+    "gap": Spacing.GAP_MD,
+    "padding": 24,
+    "fullWidth": True,
+    "crossAxisAlignment": "stretch",
+}
+
+_ROOT_PROPS_ERROR: Dict[str, Any] = {
+    **_ROOT_PROPS_MESSAGE,
+    "color": Color.ERROR_CONTAINER,
+    "borderRadius": 12,
+}
+
+# Per-hunk header lookups, resolved once at import instead of per hunk
+_HUNK_STATUS_ICONS = {
+    "pending": Icon.PENDING,
+    "accepted": Icon.CHECK,
+    "rejected": Icon.CLOSE,
+    "revised": Icon.EDIT,
+}
+
+_HUNK_KIND_LABELS = {
+    "added": "Added",
+    "removed": "Removed",
+    "modified": "Modified",
+}
+
 
 def render_note_edit_diff_dom(
     note: "Note",
@@ -68,27 +107,26 @@ def render_note_edit_diff_dom(
     total_changes = sum(status_counts.values())
     has_pending = status_counts["pending"] > 0
     
-    children: List[Dict[str, Any]] = [
-        # Header with icon and title
-        {
-            "type": "row",
-            "props": {"gap": Spacing.GAP_SM, "crossAxisAlignment": "center"},
-            "children": [
-                {"type": "icon", "props": {"icon": Icon.EDIT, "size": 24, "color": Color.PRIMARY}},
-                text_node("Proposed changes", TextStyle.HEADLINE_MEDIUM),
-            ],
-        },
-        # Subtitle with note title and version
-        text_node(
-            f"{title} (v{note.version})",
-            TextStyle.BODY_SMALL,
-            Color.ON_SURFACE_VARIANT,
-        ),
-    ]
-    
-    # Add summary if provided
+    # Header with icon and title
+    header_row: Dict[str, Any] = {
+        "type": "row",
+        "props": {"gap": Spacing.GAP_SM, "crossAxisAlignment": "center"},
+        "children": [
+            {"type": "icon", "props": {"icon": Icon.EDIT, "size": 24, "color": Color.PRIMARY}},
+            text_node("Proposed changes", TextStyle.HEADLINE_MEDIUM),
+        ],
+    }
+    # Subtitle with note title and version
+    subtitle = text_node(
+        f"{title} (v{note.version})",
+        TextStyle.BODY_SMALL,
+        Color.ON_SURFACE_VARIANT,
+    )
+
+    # Optional nodes between the subtitle and the hunks (summary, status counts)
+    extra_nodes: List[Dict[str, Any]] = []
     if summary:
-        children.append(
+        extra_nodes.append(
             text_node(summary, TextStyle.BODY_MEDIUM, Color.ON_SURFACE),
         )
     
@@ -132,21 +170,22 @@ def render_note_edit_diff_dom(
             })
         
         if status_chips:
-            children.append({
+            extra_nodes.append({
                 "type": "wrap",
                 "props": {"gap": Spacing.GAP_XS, "runSpacing": Spacing.GAP_XS},
                 "children": status_chips,
             })
     
-    # Render each hunk as a separate block
-    for hunk in hunks:
-        hunk_node = _render_hunk_block(edit_id, hunk)
-        if hunk_node:
-            children.append(hunk_node)
+    # Render each hunk as a separate block (no-op edits skip the generator entirely)
+    hunk_nodes: List[Dict[str, Any]] = []
+    if hunks:
+        hunk_nodes = [
+            node for node in (_render_hunk_block(edit_id, hunk) for hunk in hunks) if node
+        ]
     
     # Action row (Apply / Discard)
     apply_label = "Apply changes" if not has_pending else f"Resolve {status_counts['pending']} pending to apply"
-    children.append({
+    action_row: Dict[str, Any] = {
         "type": "row",
         "props": {
             "gap": Spacing.GAP_SM,
@@ -185,21 +224,13 @@ def render_note_edit_diff_dom(
                 },
             },
         ],
-    })
-    
-    # Build root props
-    root_props = {
-        "gap": Spacing.SECTION_GAP,
-        "padding": 24,
-        "fullWidth": True,
-        "crossAxisAlignment": "stretch",
     }
-    if Layout.MAX_WIDTH_DETAIL is not None:
-        root_props["maxWidth"] = Layout.MAX_WIDTH_DETAIL
-    
+
+    children = [header_row, subtitle, *extra_nodes, *hunk_nodes, action_row]
+
     return {
         "type": "column",
-        "props": root_props,
+        "props": _ROOT_PROPS_DETAIL,
         "children": children,
     }
 
@@ -239,6 +270,7 @@ def _render_hunk_block(edit_id: str, hunk: "NoteEditHunkState") -> Dict[str, Any
         }
     
     # Changed hunk - build card with header, diff, and actions
+    gap_sm = Spacing.GAP_SM
     children: List[Dict[str, Any]] = []
     
     # Header row: status chip + line range
@@ -246,12 +278,7 @@ def _render_hunk_block(edit_id: str, hunk: "NoteEditHunkState") -> Dict[str, Any
     
     # Status chip
     status_label = hunk.status.capitalize()
-    status_icon = {
-        "pending": Icon.PENDING,
-        "accepted": Icon.CHECK,
-        "rejected": Icon.CLOSE,
-        "revised": Icon.EDIT,
-    }.get(hunk.status, Icon.PENDING)
+    status_icon = _HUNK_STATUS_ICONS.get(hunk.status, Icon.PENDING)
     
     header_children.append({
         "type": "chip",
@@ -263,12 +290,7 @@ def _render_hunk_block(edit_id: str, hunk: "NoteEditHunkState") -> Dict[str, Any
     })
     
     # Kind + line range
-    kind_labels = {
-        "added": "Added",
-        "removed": "Removed",
-        "modified": "Modified",
-    }
-    kind_label = kind_labels.get(hunk.kind, hunk.kind.capitalize())
+    kind_label = _HUNK_KIND_LABELS.get(hunk.kind, hunk.kind.capitalize())
     
     line_info = ""
     if hunk.orig_start is not None and hunk.orig_end is not None:
@@ -292,7 +314,7 @@ def _render_hunk_block(edit_id: str, hunk: "NoteEditHunkState") -> Dict[str, Any
     
     children.append({
         "type": "row",
-        "props": {"gap": Spacing.GAP_SM, "crossAxisAlignment": "center"},
+        "props": {"gap": gap_sm, "crossAxisAlignment": "center"},
         "children": header_children,
     })
     
@@ -306,7 +328,7 @@ def _render_hunk_block(edit_id: str, hunk: "NoteEditHunkState") -> Dict[str, Any
         children.append({
             "type": "row",
             "props": {
-                "gap": Spacing.GAP_SM,
+                "gap": gap_sm,
                 "mainAxisAlignment": "end",
             },
             "children": [
@@ -394,7 +416,7 @@ def _render_hunk_block(edit_id: str, hunk: "NoteEditHunkState") -> Dict[str, Any
             {
                 "type": "column",
                 "props": {
-                    "gap": Spacing.GAP_SM,
+                    "gap": gap_sm,
                     "crossAxisAlignment": "stretch",
                 },
                 "children": children,
@@ -454,7 +476,7 @@ def _render_diff_content(
     
     return {
         "type": "column",
-        "props": {"gap": 0, "crossAxisAlignment": "stretch"},
+        "props": _DIFF_COLUMN_PROPS,
         "children": children,
     }
 
@@ -468,19 +490,21 @@ DIFF_REMOVED_TEXT = "#f85149"  # Bright red text
 DIFF_CONTEXT_BG = "#21262d"    # Dark gray background
 DIFF_CONTEXT_TEXT = "#8b949e"  # Gray text
 
+# Static props shared by every diff column and line node. Remote DOM trees are
+# only read when serialized, so the same dicts can back any number of nodes.
+_DIFF_COLUMN_PROPS: Dict[str, Any] = {"gap": 0, "crossAxisAlignment": "stretch"}
+_ADDED_LINE_PROPS: Dict[str, Any] = {"padding": 8, "color": DIFF_ADDED_BG}
+_REMOVED_LINE_PROPS: Dict[str, Any] = {"padding": 8, "color": DIFF_REMOVED_BG}
+
 
 def _render_diff_line(text: str, is_added: bool) -> Dict[str, Any]:
     """Render a single diff line with +/- prefix (GitHub-style)."""
     prefix = "+ " if is_added else "- "
     text_color = DIFF_ADDED_TEXT if is_added else DIFF_REMOVED_TEXT
-    bg_color = DIFF_ADDED_BG if is_added else DIFF_REMOVED_BG
 
     return {
         "type": "container",
-        "props": {
-            "padding": 8,
-            "color": bg_color,
-        },
+        "props": _ADDED_LINE_PROPS if is_added else _REMOVED_LINE_PROPS,
         "children": [
             {
                 "type": "text",
@@ -494,94 +518,6 @@ def _render_diff_line(text: str, is_added: bool) -> Dict[str, Any]:
     }
 
 
-def _render_context_line(text: str) -> Dict[str, Any]:
-    """Render an unchanged context line."""
-    return {
-        "type": "container",
-        "props": {
-            "padding": 8,
-            "color": DIFF_CONTEXT_BG,
-        },
-        "children": [
-            {
-                "type": "text",
-                "props": {
-                    "text": f"  {text}",
-                    "style": TextStyle.BODY_SMALL,
-                    "color": DIFF_CONTEXT_TEXT,
-                },
-            },
-        ],
-    }
-
-
-def _render_diff_hunk(hunk: "DiffHunk") -> Dict[str, Any] | None:
-    """Render a single diff hunk as GitHub-style diff lines."""
-    if hunk.kind == "unchanged":
-        if not hunk.original:
-            return None
-        # Show context lines (up to 3 lines for brevity)
-        lines = hunk.original.split('\n')
-        if len(lines) > 3:
-            # Show first line, ellipsis, last line
-            children = [
-                _render_context_line(lines[0]),
-                {
-                    "type": "container",
-                    "props": {"padding": 4, "color": DIFF_CONTEXT_BG},
-                    "children": [
-                        text_node(f"  ... ({len(lines) - 2} more lines)", TextStyle.BODY_SMALL, DIFF_CONTEXT_TEXT),
-                    ],
-                },
-                _render_context_line(lines[-1]),
-            ]
-        else:
-            children = [_render_context_line(line) for line in lines]
-
-        return {
-            "type": "column",
-            "props": {"gap": 0, "crossAxisAlignment": "stretch"},
-            "children": children,
-        }
-
-    elif hunk.kind == "removed":
-        lines = hunk.original.split('\n')
-        return {
-            "type": "column",
-            "props": {"gap": 0, "crossAxisAlignment": "stretch"},
-            "children": [_render_diff_line(line, is_added=False) for line in lines],
-        }
-
-    elif hunk.kind == "added":
-        lines = hunk.proposed.split('\n')
-        return {
-            "type": "column",
-            "props": {"gap": 0, "crossAxisAlignment": "stretch"},
-            "children": [_render_diff_line(line, is_added=True) for line in lines],
-        }
-
-    elif hunk.kind == "modified":
-        children: List[Dict[str, Any]] = []
-
-        # Show removed lines first (red with -)
-        if hunk.original:
-            for line in hunk.original.split('\n'):
-                children.append(_render_diff_line(line, is_added=False))
-
-        # Then added lines (green with +)
-        if hunk.proposed:
-            for line in hunk.proposed.split('\n'):
-                children.append(_render_diff_line(line, is_added=True))
-
-        return {
-            "type": "column",
-            "props": {"gap": 0, "crossAxisAlignment": "stretch"},
-            "children": children,
-        }
-
-    return None
-
-
 def render_note_edit_success_dom(
     note: "Note",
 ) -> Dict[str, Any]:
@@ -600,24 +536,6 @@ def render_note_edit_success_dom(
     content = (note.payload.get("content") or "").strip()
     tags = note.payload.get("tags") or []
 
-    children: List[Dict[str, Any]] = [
-        # Success header
-        {
-            "type": "row",
-            "props": {"gap": Spacing.GAP_SM, "crossAxisAlignment": "center"},
-            "children": [
-                {"type": "icon", "props": {"icon": Icon.CHECK_CIRCLE, "size": 24, "color": Color.PRIMARY}},
-                text_node("Changes applied", TextStyle.HEADLINE_MEDIUM),
-            ],
-        },
-        # Subtitle
-        text_node(
-            f"Updated to v{note.version}",
-            TextStyle.BODY_SMALL,
-            Color.ON_SURFACE_VARIANT,
-        ),
-    ]
-
     # Updated content card
     content_children: List[Dict[str, Any]] = [
         # Note title
@@ -641,39 +559,46 @@ def render_note_edit_success_dom(
 
     # Note content
     if content:
-        content_children.append({
-            "type": "divider",
-            "props": {"margin": Spacing.GAP_SM},
-        })
-        content_children.append(
-            text_node(content, TextStyle.BODY_MEDIUM, Color.ON_SURFACE),
-        )
-
-    children.append({
-        "type": "card",
-        "props": {"padding": 20},
-        "children": [
+        content_children += [
             {
-                "type": "column",
-                "props": {"gap": Spacing.GAP_MD, "crossAxisAlignment": "stretch"},
-                "children": content_children,
-            }
-        ],
-    })
+                "type": "divider",
+                "props": {"margin": Spacing.GAP_SM},
+            },
+            text_node(content, TextStyle.BODY_MEDIUM, Color.ON_SURFACE),
+        ]
 
-    # Build root props
-    root_props = {
-        "gap": Spacing.SECTION_GAP,
-        "padding": 24,
-        "fullWidth": True,
-        "crossAxisAlignment": "stretch",
-    }
-    if Layout.MAX_WIDTH_DETAIL is not None:
-        root_props["maxWidth"] = Layout.MAX_WIDTH_DETAIL
+    children: List[Dict[str, Any]] = [
+        # Success header
+        {
+            "type": "row",
+            "props": {"gap": Spacing.GAP_SM, "crossAxisAlignment": "center"},
+            "children": [
+                {"type": "icon", "props": {"icon": Icon.CHECK_CIRCLE, "size": 24, "color": Color.PRIMARY}},
+                text_node("Changes applied", TextStyle.HEADLINE_MEDIUM),
+            ],
+        },
+        # Subtitle
+        text_node(
+            f"Updated to v{note.version}",
+            TextStyle.BODY_SMALL,
+            Color.ON_SURFACE_VARIANT,
+        ),
+        {
+            "type": "card",
+            "props": {"padding": 20},
+            "children": [
+                {
+                    "type": "column",
+                    "props": {"gap": Spacing.GAP_MD, "crossAxisAlignment": "stretch"},
+                    "children": content_children,
+                }
+            ],
+        },
+    ]
 
     return {
         "type": "column",
-        "props": root_props,
+        "props": _ROOT_PROPS_DETAIL,
         "children": children,
     }
 
@@ -707,17 +632,9 @@ def render_note_edit_discarded_dom(
         ),
     ]
     
-    # Build root props
-    root_props = {
-        "gap": Spacing.GAP_MD,
-        "padding": 24,
-        "fullWidth": True,
-        "crossAxisAlignment": "stretch",
-    }
-    
     return {
         "type": "column",
-        "props": root_props,
+        "props": _ROOT_PROPS_MESSAGE,
         "children": children,
     }
 
@@ -758,18 +675,27 @@ def render_note_edit_error_dom(
             )
         )
     
-    # Build root props
-    root_props = {
-        "gap": Spacing.GAP_MD,
-        "padding": 24,
-        "fullWidth": True,
-        "crossAxisAlignment": "stretch",
-        "color": Color.ERROR_CONTAINER,
-        "borderRadius": 12,
-    }
-    
     return {
         "type": "column",
-        "props": root_props,
+        "props": _ROOT_PROPS_ERROR,
         "children": children,
     }
+
+
+# Only the serialized discarded DOM is cached: it is keyed by note title alone,
+# so repeated discards of the same note reuse the string. The tree itself is
+# not cached, so each title is stored once.
+@lru_cache(maxsize=256)
+def render_note_edit_discarded_dom_json(title: str) -> str:
+    """Serialized form of render_note_edit_discarded_dom, cached per title."""
+    return json.dumps(render_note_edit_discarded_dom(title), separators=(",", ":"))
+
+
+def render_note_edit_error_dom_json(
+    error_message: str,
+    note_uid: str | None = None,
+) -> str:
+    """Serialized form of render_note_edit_error_dom (uncached; messages are one-off)."""
+    return json.dumps(
+        render_note_edit_error_dom(error_message, note_uid), separators=(",", ":")
+    )
@@ -68,7 +68,7 @@ def _build_html_resource(uri: str, html: str) -> EmbeddedResource:
 
 def _build_remote_dom_resource(
     uri: str,
-    dom: Dict[str, Any],
+    dom: Union[Dict[str, Any], str],
     ui_metadata: Optional[Dict[str, Any]] = None,
     metadata: Optional[Dict[str, Any]] = None,
 ) -> EmbeddedResource:
@@ -77,14 +77,15 @@ def _build_remote_dom_resource(
 
     Args:
         uri: Stable ui:// URI for caching and identity
-        dom: Remote DOM tree (root node dict) compatible with RemoteDomNode.fromJson
+        dom: Remote DOM tree (root node dict) compatible with RemoteDomNode.fromJson,
+            or an already-serialized JSON string of such a tree
         ui_metadata: Optional additional uiMetadata fields (e.g., chat.frameStyle, chat.maxWidth)
         metadata: Optional additional metadata fields
 
     Returns:
         EmbeddedResource with application/vnd.mcp-ui.remote-dom mimeType
     """
-    dom_json = json.dumps(dom, separators=(",", ":"))
+    dom_json = dom if isinstance(dom, str) else json.dumps(dom, separators=(",", ":"))
 
     # Base uiMetadata
     base_ui_metadata: Dict[str, Any] = {
@@ -156,7 +157,7 @@ def build_ui_with_text(
 def build_ui_with_text_and_dom(
     uri: str,
     html: Optional[str],
-    remote_dom: Optional[Dict[str, Any]],
+    remote_dom: Optional[Union[Dict[str, Any], str]],
     text_summary: str,
     ui_format: UIFormat,
     remote_dom_ui_metadata: Optional[Dict[str, Any]] = None,
@@ -168,7 +169,8 @@ def build_ui_with_text_and_dom(
     Args:
         uri: Stable ui:// URI for caching and identity
         html: HTML markup (required when ui_format is HTML or BOTH)
-        remote_dom: Remote DOM tree dict (required when ui_format is REMOTE_DOM or BOTH)
+        remote_dom: Remote DOM tree dict or its serialized JSON string
+            (required when ui_format is REMOTE_DOM or BOTH)
         text_summary: Human-readable explanation for non-UI hosts
         ui_format: Which format(s) to include in the response
         remote_dom_ui_metadata: Optional uiMetadata for Remote DOM resource
@@ -0,0 +1,35 @@
+"""
+Shared HTML helpers for the MCP-UI templates.
+
+Escaping and small markup fragments used by more than one template module
+(notes.py, tasks.py, note_edits.py).
+"""
+
+import re
+from typing import Iterable
+from html import escape
+
+
+# Most titles, UIDs, and tags contain no HTML-special characters, so scan once
+# and only fall back to html.escape when something actually needs replacing.
+_HTML_UNSAFE = re.compile(r"[&<>\"']").search
+
+
+def esc(s: str) -> str:
+    """Escape HTML special characters, returning clean strings unchanged."""
+    if not s:
+        return ""
+    return escape(s) if _HTML_UNSAFE(s) else s
+
+
+_TAGS_OPEN = '<div class="tags">'
+_TAGS_CLOSE = "</div>"
+
+
+def render_tags(tags: Iterable) -> str:
+    """Render a tags row shared by the note and task detail views."""
+    if not tags:
+        return ""
+    return _TAGS_OPEN + "".join(
+        f'<span class="tag">{esc(str(tag))}</span>' for tag in tags
+    ) + _TAGS_CLOSE
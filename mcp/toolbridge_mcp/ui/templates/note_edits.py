@@ -6,7 +6,8 @@ matching the Remote DOM templates in ui/remote_dom/note_edits.py.
 """
 
 from typing import Iterable, TYPE_CHECKING
-from html import escape
+
+from toolbridge_mcp.ui.templates._html import esc
 
 if TYPE_CHECKING:
     from toolbridge_mcp.tools.notes import Note
@@ -56,8 +57,8 @@ def render_note_edit_diff_html(
         HTML string with the diff preview UI
     """
     hunks_list = list(hunks)
-    title = escape((note.payload.get("title") or "Untitled note").strip())
-    edit_id_escaped = escape(edit_id)
+    title = esc((note.payload.get("title") or "Untitled note").strip())
+    edit_id_escaped = esc(edit_id)
 
     # Calculate status counts (excluding unchanged)
     status_counts = {"pending": 0, "accepted": 0, "rejected": 0, "revised": 0}
@@ -83,16 +84,14 @@ def render_note_edit_diff_html(
         status_chips_html = '<div class="status-chips">' + "".join(chips) + "</div>"
 
     # Build hunks HTML
-    hunks_html = ""
-    for hunk in hunks_list:
-        hunk_html = _render_hunk_block_html(edit_id_escaped, hunk)
-        if hunk_html:
-            hunks_html += hunk_html
+    hunks_html = "".join(
+        _render_hunk_block_html(edit_id_escaped, hunk) for hunk in hunks_list
+    )
 
     # Summary text
     summary_html = ""
     if summary:
-        summary_html = f'<p class="summary-text">{escape(summary)}</p>'
+        summary_html = f'<p class="summary-text">{esc(summary)}</p>'
 
     # Apply button label
     apply_label = "Apply changes" if not has_pending else f"Resolve {status_counts['pending']} pending to apply"
@@ -440,12 +439,12 @@ def _render_hunk_block_html(edit_id: str, hunk: "NoteEditHunkState") -> str:
         if len(lines) > 3:
             context_text = f"... ({len(lines)} unchanged lines) ..."
         else:
-            context_text = escape(hunk.original)
+            context_text = esc(hunk.original)
 
         return f'<div class="unchanged-block"><span class="unchanged-text">{context_text}</span></div>'
 
     # Changed hunk - build card with header, diff, and actions
-    hunk_id = escape(hunk.id)
+    hunk_id = esc(hunk.id)
     status = hunk.status
 
     # Kind + line range
@@ -507,7 +506,7 @@ def _render_diff_content_html(
     revised_text: str | None = None,
 ) -> str:
     """Render the diff content for a hunk."""
-    lines_html = ""
+    lines: list[str] = []
 
     # Use revised_text if available
     display_proposed = revised_text if revised_text is not None else proposed
@@ -515,27 +514,27 @@ def _render_diff_content_html(
     if kind == "removed":
         # Show removed lines
         for line in original.split('\n'):
-            lines_html += f'<div class="diff-line removed">- {escape(line)}</div>'
+            lines.append(f'<div class="diff-line removed">- {esc(line)}</div>')
         # If revised, also show the replacement text
         if revised_text:
             for line in revised_text.split('\n'):
-                lines_html += f'<div class="diff-line added">+ {escape(line)}</div>'
+                lines.append(f'<div class="diff-line added">+ {esc(line)}</div>')
 
     elif kind == "added":
         # Only show added lines
         for line in display_proposed.split('\n'):
-            lines_html += f'<div class="diff-line added">+ {escape(line)}</div>'
+            lines.append(f'<div class="diff-line added">+ {esc(line)}</div>')
 
     elif kind == "modified":
         # Show removed then added
         if original:
             for line in original.split('\n'):
-                lines_html += f'<div class="diff-line removed">- {escape(line)}</div>'
+                lines.append(f'<div class="diff-line removed">- {esc(line)}</div>')
         if display_proposed:
             for line in display_proposed.split('\n'):
-                lines_html += f'<div class="diff-line added">+ {escape(line)}</div>'
+                lines.append(f'<div class="diff-line added">+ {esc(line)}</div>')
 
-    return lines_html
+    return "".join(lines)
 
 
 def render_note_edit_success_html(note: "Note") -> str:
@@ -548,14 +547,14 @@ def render_note_edit_success_html(note: "Note") -> str:
     Returns:
         HTML string with success confirmation
     """
-    title = escape((note.payload.get("title") or "Untitled note").strip())
-    content = escape((note.payload.get("content") or "").strip())
+    title = esc((note.payload.get("title") or "Untitled note").strip())
+    content = esc((note.payload.get("content") or "").strip())
     tags = note.payload.get("tags") or []
 
     tags_html = ""
     if tags:
         tags_html = '<div class="tags">' + "".join(
-            f'<span class="tag">{escape(str(tag))}</span>' for tag in tags[:5]
+            f'<span class="tag">{esc(str(tag))}</span>' for tag in tags[:5]
         ) + "</div>"
 
     return f"""
@@ -708,7 +707,7 @@ def render_note_edit_discarded_html(title: str) -> str:
             <span class="header-icon">✗</span>
             <h1>Changes discarded</h1>
         </div>
-        <p class="message">Pending edits for '{escape(title)}' have been discarded.</p>
+        <p class="message">Pending edits for '{esc(title)}' have been discarded.</p>
     </body>
     </html>
     """
@@ -794,7 +793,7 @@ def render_note_edit_error_html(
                 <span class="header-icon">⚠</span>
                 <h1>Failed to apply changes</h1>
             </div>
-            <p class="error-message">{escape(error_message)}</p>
+            <p class="error-message">{esc(error_message)}</p>
             {retry_hint}
         </div>
     </body>
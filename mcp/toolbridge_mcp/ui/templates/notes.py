@@ -9,12 +9,29 @@ NOTE: These are minimal stub templates. A future ticket will add:
 """
 
 from typing import Iterable, TYPE_CHECKING
-from html import escape
+
+from toolbridge_mcp.ui.templates._html import esc, render_tags
 
 if TYPE_CHECKING:
     from toolbridge_mcp.tools.notes import Note
 
 
+_EMPTY_NOTES_HTML = """
+        <html>
+        <head>
+            <style>
+                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 16px; }
+                .empty { color: #666; font-style: italic; }
+            </style>
+        </head>
+        <body>
+            <h2>📝 Notes</h2>
+            <p class="empty">No notes found.</p>
+        </body>
+        </html>
+        """
+
+
 def render_notes_list_html(
     notes: Iterable["Note"],
     limit: int = 20,
@@ -34,31 +51,19 @@ def render_notes_list_html(
     notes_list = list(notes)
 
     if not notes_list:
-        return """
-        <html>
-        <head>
-            <style>
-                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; padding: 16px; }
-                .empty { color: #666; font-style: italic; }
-            </style>
-        </head>
-        <body>
-            <h2>📝 Notes</h2>
-            <p class="empty">No notes found.</p>
-        </body>
-        </html>
-        """
+        return _EMPTY_NOTES_HTML
 
-    items_html = ""
+    items: list[str] = []
     for note in notes_list:
-        title = escape(note.payload.get("title") or "Untitled")
-        content_raw = note.payload.get("content") or ""
-        content_preview = escape(content_raw[:100])
+        payload = note.payload
+        title = esc(payload.get("title") or "Untitled")
+        content_raw = payload.get("content") or ""
+        content_preview = esc(content_raw[:100])
         if len(content_raw) > 100:
             content_preview += "..."
-        uid = escape(note.uid)
+        uid = esc(note.uid)
 
-        items_html += f"""
+        items.append(f"""
         <li class="note-item" data-uid="{uid}">
             <div class="note-title">{title}</div>
             <div class="note-preview">{content_preview}</div>
@@ -68,7 +73,8 @@ def render_notes_list_html(
                 <button class="btn btn-delete" onclick="deleteNote('{uid}')">🗑️ Delete</button>
             </div>
         </li>
-        """
+        """)
+    items_html = "".join(items)
 
     return f"""
     <html>
@@ -244,21 +250,18 @@ def render_note_detail_html(note: "Note") -> str:
     Returns:
         HTML string with the full note content
     """
-    title = escape(note.payload.get("title") or "Untitled")
-    content = escape(note.payload.get("content") or "No content")
-    uid = escape(note.uid)
-    tags = note.payload.get("tags") or []
+    payload = note.payload
+    title = esc(payload.get("title") or "Untitled")
+    content = esc(payload.get("content") or "No content")
+    uid = esc(note.uid)
+    tags = payload.get("tags") or []
 
-    tags_html = ""
-    if tags:
-        tags_html = '<div class="tags">' + "".join(
-            f'<span class="tag">{escape(str(tag))}</span>' for tag in tags
-        ) + "</div>"
+    tags_html = render_tags(tags)
 
-    status = note.payload.get("status") or ""
+    status = payload.get("status") or ""
     status_badge = ""
     if status:
-        status_badge = f'<span class="status-badge status-{escape(status)}">{escape(status)}</span>'
+        status_badge = f'<span class="status-badge status-{esc(status)}">{esc(status)}</span>'
 
     return f"""
     <html>
@@ -303,7 +306,7 @@ def render_note_detail_html(note: "Note") -> str:
         {tags_html}
         <div class="content">{content}</div>
         <div class="meta">
-            UID: {uid} | Version: {note.version} | Updated: {escape(note.updated_at)}
+            UID: {uid} | Version: {note.version} | Updated: {esc(note.updated_at)}
         </div>
     </body>
     </html>
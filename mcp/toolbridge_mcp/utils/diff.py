@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from typing import List, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffHunk:
     """
     A single hunk of a diff.
@@ -40,7 +40,7 @@ class DiffHunk:
     _new_line_count: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HunkDecision:
     """
     User decision for a single diff hunk.
@@ -97,26 +97,24 @@ def compute_line_diff(
             proposed="",
         )]
     
-    matcher = difflib.SequenceMatcher(a=orig_lines, b=new_lines)
     hunks: List[DiffHunk] = []
-    
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        # Join lines preserving their endings exactly.
-        # We keep trailing newlines intact and concatenate segments directly in _join_segments,
-        # which preserves the original file structure (including trailing newline or lack thereof).
-        orig_text = "".join(orig_lines[i1:i2])
-        new_text = "".join(new_lines[j1:j2])
-        
-        # Compute accurate line counts from difflib indices (not from stripped text)
-        orig_line_count = i2 - i1
-        new_line_count = j2 - j1
-
+    append = hunks.append
+
+    # Lines are joined with their endings intact and concatenated directly in
+    # _join_segments, which preserves the original file structure (including a
+    # trailing newline or lack thereof). Each branch only joins the side it
+    # emits, and line counts come straight from the difflib indices rather than
+    # from re-splitting the joined text.
+    for tag, i1, i2, j1, j2 in _line_opcodes(orig_lines, new_lines):
         if tag == "equal":
             # Unchanged section - optionally truncate if too long (for display only)
             # Always emit the hunk, even for blank-line-only sections (orig_text == "")
             # to preserve blank lines when applying decisions.
+            orig_text = "".join(orig_lines[i1:i2])
             display_text = orig_text
-            if truncate_unchanged and orig_text:
+            # Splitting on "\n" yields at most one more piece than there are
+            # lines, so shorter sections can never need truncating
+            if truncate_unchanged and orig_text and i2 - i1 >= max_unchanged_lines:
                 lines = orig_text.split("\n")
                 if len(lines) > max_unchanged_lines:
                     # Show first and last few lines
@@ -126,50 +124,93 @@ def compute_line_diff(
                         f"\n... ({len(lines) - max_unchanged_lines} lines unchanged) ...\n" +
                         "\n".join(lines[-half:])
                     )
-            hunks.append(DiffHunk(
+            append(DiffHunk(
                 kind="unchanged",
                 original=display_text,
                 proposed=display_text,
-                _orig_line_count=orig_line_count,
-                _new_line_count=new_line_count,
+                _orig_line_count=i2 - i1,
+                _new_line_count=j2 - j1,
             ))
 
         elif tag == "replace":
             # Modified section
-            hunks.append(DiffHunk(
+            append(DiffHunk(
                 kind="modified",
-                original=orig_text,
-                proposed=new_text,
-                _orig_line_count=orig_line_count,
-                _new_line_count=new_line_count,
+                original="".join(orig_lines[i1:i2]),
+                proposed="".join(new_lines[j1:j2]),
+                _orig_line_count=i2 - i1,
+                _new_line_count=j2 - j1,
             ))
 
         elif tag == "delete":
             # Removed section
-            hunks.append(DiffHunk(
+            append(DiffHunk(
                 kind="removed",
-                original=orig_text,
+                original="".join(orig_lines[i1:i2]),
                 proposed="",
-                _orig_line_count=orig_line_count,
+                _orig_line_count=i2 - i1,
                 _new_line_count=0,
             ))
 
         elif tag == "insert":
             # Added section
-            hunks.append(DiffHunk(
+            append(DiffHunk(
                 kind="added",
                 original="",
-                proposed=new_text,
+                proposed="".join(new_lines[j1:j2]),
                 _orig_line_count=0,
-                _new_line_count=new_line_count,
+                _new_line_count=j2 - j1,
             ))
     
     # Merge consecutive hunks of the same kind to reduce noise
     return _merge_consecutive_hunks(hunks)
 
 
+def _line_opcodes(a: List[str], b: List[str]) -> List[tuple]:
+    """
+    Compute SequenceMatcher opcodes, matching the common prefix/suffix up front.
+
+    Edits usually touch one region of a note, so trimming the identical head
+    and tail keeps difflib's quadratic matching confined to the changed middle.
+
+    Args:
+        a: Original lines
+        b: Proposed lines
+
+    Returns:
+        List of (tag, i1, i2, j1, j2) opcodes indexing into a and b
+    """
+    n = min(len(a), len(b))
+    lo = 0
+    while lo < n and a[lo] == b[lo]:
+        lo += 1
+    hi = 0
+    while hi < n - lo and a[-1 - hi] == b[-1 - hi]:
+        hi += 1
+
+    a_end = len(a) - hi
+    b_end = len(b) - hi
+    opcodes: List[tuple] = []
+    if lo:
+        opcodes.append(("equal", 0, lo, 0, lo))
+    if lo < a_end or lo < b_end:
+        matcher = difflib.SequenceMatcher(a=a[lo:a_end], b=b[lo:b_end])
+        opcodes.extend(
+            (tag, i1 + lo, i2 + lo, j1 + lo, j2 + lo)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        )
+    if hi:
+        opcodes.append(("equal", a_end, len(a), b_end, len(b)))
+    return opcodes
+
+
 def _merge_consecutive_hunks(hunks: List[DiffHunk]) -> List[DiffHunk]:
-    """Merge consecutive hunks of the same kind."""
+    """
+    Merge consecutive hunks of the same kind.
+
+    Merges extend the current hunk in place, so the input hunks must be fresh
+    objects owned by the caller (compute_line_diff builds them just before).
+    """
     if not hunks:
         return []
 
@@ -179,13 +220,10 @@ def _merge_consecutive_hunks(hunks: List[DiffHunk]) -> List[DiffHunk]:
     for hunk in hunks[1:]:
         if hunk.kind == current.kind:
             # Merge into current, summing line counts
-            current = DiffHunk(
-                kind=current.kind,
-                original=_join_texts(current.original, hunk.original),
-                proposed=_join_texts(current.proposed, hunk.proposed),
-                _orig_line_count=(current._orig_line_count or 0) + (hunk._orig_line_count or 0),
-                _new_line_count=(current._new_line_count or 0) + (hunk._new_line_count or 0),
-            )
+            current.original = _join_texts(current.original, hunk.original)
+            current.proposed = _join_texts(current.proposed, hunk.proposed)
+            current._orig_line_count = (current._orig_line_count or 0) + (hunk._orig_line_count or 0)
+            current._new_line_count = (current._new_line_count or 0) + (hunk._new_line_count or 0)
         else:
             merged.append(current)
             current = hunk
@@ -303,51 +341,35 @@ def apply_hunk_decisions(
         ValueError: If any changed hunk is still pending
     """
     segments: List[str] = []
-    
+    append = segments.append
+
     for hunk in hunks:
+        kind = hunk.kind
+        if kind == "unchanged":
+            # Unchanged hunks always use original (same as proposed)
+            append(hunk.original)
+            continue
+        if kind not in ("added", "removed", "modified"):
+            continue
+
         hunk_id = hunk.id or ""
         decision = decisions.get(hunk_id)
-        
-        if hunk.kind == "unchanged":
-            # Unchanged hunks always use original (same as proposed)
-            segments.append(hunk.original)
-        
-        elif hunk.kind == "added":
-            if decision is None or decision.status == "pending":
-                raise ValueError(f"Hunk {hunk_id} is pending - cannot apply")
-            elif decision.status == "accepted":
-                segments.append(hunk.proposed)
-            elif decision.status == "rejected":
-                # Reject addition = don't include it
-                pass
-            elif decision.status == "revised":
-                if decision.revised_text is not None:
-                    segments.append(decision.revised_text)
-        
-        elif hunk.kind == "removed":
-            if decision is None or decision.status == "pending":
-                raise ValueError(f"Hunk {hunk_id} is pending - cannot apply")
-            elif decision.status == "accepted":
-                # Accept removal = don't include original
-                pass
-            elif decision.status == "rejected":
-                # Reject removal = keep original
-                segments.append(hunk.original)
-            elif decision.status == "revised":
-                if decision.revised_text is not None:
-                    segments.append(decision.revised_text)
-        
-        elif hunk.kind == "modified":
-            if decision is None or decision.status == "pending":
-                raise ValueError(f"Hunk {hunk_id} is pending - cannot apply")
-            elif decision.status == "accepted":
-                segments.append(hunk.proposed)
-            elif decision.status == "rejected":
-                segments.append(hunk.original)
-            elif decision.status == "revised":
-                if decision.revised_text is not None:
-                    segments.append(decision.revised_text)
-    
+        if decision is None or decision.status == "pending":
+            raise ValueError(f"Hunk {hunk_id} is pending - cannot apply")
+
+        status = decision.status
+        if status == "accepted":
+            # Accept removal = don't include original
+            if kind != "removed":
+                append(hunk.proposed)
+        elif status == "rejected":
+            # Reject addition = don't include it
+            if kind != "added":
+                append(hunk.original)
+        elif status == "revised":
+            if decision.revised_text is not None:
+                append(decision.revised_text)
+
     # Join segments with newlines, preserving structure
     return _join_segments(segments)
 
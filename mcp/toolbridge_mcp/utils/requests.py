@@ -8,15 +8,18 @@ WorkOS AuthKit OAuth 2.1 Flow:
 4. Backend JWT sent to Go API with tenant header
 5. Go API validates backend JWT and creates per-user session
 
-Session management: Each request creates a fresh sync session before calling
-the API. Sessions are NOT cached or reused to avoid stale session issues.
+Session management: Sync sessions are cached per user (see utils/session.py)
+and shared by every API call of an MCP request. If the Go API rejects a session
+as expired (428) or from an old epoch (409 epoch_mismatch), the cached session
+is dropped and the call is retried once with a fresh one.
 
 Tenant resolution: Supports two modes:
 - Single-tenant mode: TENANT_ID env var set → uses hardcoded tenant (smoke testing)
 - Multi-tenant mode: TENANT_ID not set → dynamically resolves via /v1/auth/tenant (primary mode)
 """
 
-from typing import Any, Dict, Optional
+from contextvars import ContextVar
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import httpx
 from fastmcp.server.dependencies import get_access_token
@@ -24,12 +27,11 @@ from loguru import logger
 
 from toolbridge_mcp.auth import (
     exchange_for_backend_jwt,
-    extract_user_id_from_backend_jwt,
     resolve_tenant,
     TenantResolutionError,
 )
 from toolbridge_mcp.config import settings
-from toolbridge_mcp.utils.session import create_session
+from toolbridge_mcp.utils.session import create_session, invalidate_session
 
 
 class AuthorizationError(Exception):
@@ -45,6 +47,12 @@ _tenant_cache: Dict[str, str] = {}
 # Prevents double token exchange per request (ensure_tenant_resolved + get_backend_auth_header)
 _jwt_cache: Dict[str, str] = {}
 
+# Composed backend headers for the current MCP request: (MCP token, headers)
+# Set by _auth_headers so the API calls of one tool invocation share a session
+_request_headers: ContextVar[Optional[Tuple[str, httpx.Headers]]] = ContextVar(
+    "toolbridge_request_headers", default=None
+)
+
 
 def get_cached_tenant_id(user_id: str) -> Optional[str]:
     """Get cached tenant ID for specific user."""
@@ -190,28 +198,147 @@ async def get_backend_auth_header(client: httpx.AsyncClient) -> str:
 
 
 
-async def ensure_session(client: httpx.AsyncClient, auth_header: str) -> Dict[str, str]:
+def _session_user_id(access_token: Any) -> str:
+    """
+    Get the AuthKit-validated user ID that keys the sync session cache.
+
+    Uses the MCP token's sub claim, like _tenant_cache and _jwt_cache, rather
+    than the unverified backend JWT. Returns "unknown" when there is no token
+    or sub, which create_session never caches.
+    """
+    user_id = access_token.claims.get("sub") if access_token else None
+    return user_id or "unknown"
+
+
+async def ensure_session(
+    client: httpx.AsyncClient, auth_header: str, user_id: str
+) -> Mapping[str, str]:
     """
-    Create a fresh sync session for this request.
+    Get the sync session for the current MCP user.
 
-    Always creates a new session - no caching or reuse.
-    This ensures MCP tools can recover from session expiration.
+    Reuses the user's cached session when available (see create_session).
+    Stale sessions are recovered by _send, which invalidates and retries.
 
     Args:
         client: httpx client (with TenantDirectTransport)
         auth_header: Backend JWT Authorization header
+        user_id: AuthKit-validated user ID (see _session_user_id)
 
     Returns:
-        Dict with session headers
+        Read-only mapping with session headers (shared across requests)
     """
-    # Extract user ID from backend JWT
-    token = auth_header[7:]  # Remove "Bearer " prefix
-    user_id = extract_user_id_from_backend_jwt(token)
-    
-    # Always create a fresh session for each request
     return await create_session(client, auth_header, user_id)
 
 
+async def _auth_headers(client: httpx.AsyncClient) -> httpx.Headers:
+    """
+    Build the backend request headers once per MCP request.
+
+    Resolves the tenant, fetches the backend Authorization header and creates
+    a sync session on the first API call of a request, then reuses the result
+    for the remaining calls of that request. The cached value lives in a
+    ContextVar keyed by the caller's MCP token: each tool invocation runs in
+    its own task, so it never outlives (or leaks across) the request.
+
+    Args:
+        client: httpx client (with TenantDirectTransport)
+
+    Returns:
+        Prebuilt httpx.Headers with Authorization and sync session headers, so
+        httpx does not re-normalize them per call. Shared across calls in the
+        request - copy before adding per-call headers.
+
+    Raises:
+        AuthorizationError: If tenant resolution or token exchange fails
+    """
+    access_token = get_access_token()
+    mcp_token = access_token.token if access_token else None
+
+    cached = _request_headers.get()
+    if cached is not None and mcp_token is not None and cached[0] == mcp_token:
+        return cached[1]
+
+    # Ensure tenant is resolved (single-tenant mode or dynamic resolution)
+    await ensure_tenant_resolved(client)
+
+    auth_header = await get_backend_auth_header(client)
+    session_headers = await ensure_session(
+        client, auth_header, _session_user_id(access_token)
+    )
+
+    headers = httpx.Headers({
+        "Authorization": auth_header,
+        **session_headers,
+    })
+    if mcp_token is not None:
+        _request_headers.set((mcp_token, headers))
+    return headers
+
+
+def _is_stale_session(response: httpx.Response) -> bool:
+    """
+    Check whether the Go API rejected the request's sync session.
+
+    428 means the session is missing or expired; 409 with epoch_mismatch means
+    the tenant was reset since the session was created. Other 409s are
+    version conflicts and must reach the caller unchanged.
+    """
+    if response.status_code == 428:
+        return True
+    if response.status_code == 409:
+        try:
+            body = response.json()
+        except ValueError:
+            return False
+        return isinstance(body, dict) and body.get("error") == "epoch_mismatch"
+    return False
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    extra_headers: Optional[Dict[str, str]] = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Send a request to the Go API with auth and sync session headers.
+
+    Retries once with a fresh sync session when the cached one is stale.
+
+    Args:
+        client: httpx client (with TenantDirectTransport)
+        method: HTTP method
+        path: API endpoint path
+        extra_headers: Per-call headers added on top of the shared ones
+        **kwargs: Passed through to client.request (params, json)
+
+    Returns:
+        HTTP response
+
+    Raises:
+        httpx.HTTPStatusError: If request fails
+        AuthorizationError: If Authorization header missing or tenant resolution fails
+    """
+    for attempt in range(2):
+        headers = await _auth_headers(client)
+        if extra_headers:
+            headers = headers.copy()
+            headers.update(extra_headers)
+
+        response = await client.request(method, path, headers=headers, **kwargs)
+        if attempt == 0 and _is_stale_session(response):
+            user_id = _session_user_id(get_access_token())
+            logger.info(f"Sync session rejected ({response.status_code}) for user {user_id}, retrying")
+            invalidate_session(user_id)
+            _request_headers.set(None)
+            continue
+        break
+
+    response.raise_for_status()
+    return response
+
+
 async def call_get(
     client: httpx.AsyncClient,
     path: str,
@@ -220,7 +347,7 @@ async def call_get(
     """
     Make GET request to Go API.
 
-    Ensures tenant is resolved, creates a fresh sync session, and includes all required headers.
+    Ensures tenant is resolved, uses the request's sync session, and includes all required headers.
 
     Args:
         client: httpx client (with TenantDirectTransport)
@@ -234,21 +361,8 @@ async def call_get(
         httpx.HTTPStatusError: If request fails
         AuthorizationError: If Authorization header missing or tenant resolution fails
     """
-    # Ensure tenant is resolved (single-tenant mode or dynamic resolution)
-    await ensure_tenant_resolved(client)
-
-    auth_header = await get_backend_auth_header(client)
-    session_headers = await ensure_session(client, auth_header)
-
-    headers = {
-        "Authorization": auth_header,
-        **session_headers,
-    }
-
-    logger.debug(f"GET {path} params={params}")
-    response = await client.get(path, params=params, headers=headers)
-    response.raise_for_status()
-    return response
+    logger.debug("GET {} params={}", path, params)
+    return await _send(client, "GET", path, params=params)
 
 
 async def call_post(
@@ -259,7 +373,7 @@ async def call_post(
     """
     Make POST request to Go API.
 
-    Ensures tenant is resolved, creates a fresh sync session, and includes all required headers.
+    Ensures tenant is resolved, uses the request's sync session, and includes all required headers.
 
     Args:
         client: httpx client (with TenantDirectTransport)
@@ -273,21 +387,8 @@ async def call_post(
         httpx.HTTPStatusError: If request fails
         AuthorizationError: If Authorization header missing or tenant resolution fails
     """
-    # Ensure tenant is resolved (single-tenant mode or dynamic resolution)
-    await ensure_tenant_resolved(client)
-
-    auth_header = await get_backend_auth_header(client)
-    session_headers = await ensure_session(client, auth_header)
-
-    headers = {
-        "Authorization": auth_header,
-        **session_headers,
-    }
-
-    logger.debug(f"POST {path}")
-    response = await client.post(path, json=json, headers=headers)
-    response.raise_for_status()
-    return response
+    logger.debug("POST {}", path)
+    return await _send(client, "POST", path, json=json)
 
 
 async def call_put(
@@ -299,7 +400,7 @@ async def call_put(
     """
     Make PUT request to Go API.
 
-    Ensures tenant is resolved, creates a fresh sync session, and includes all required headers.
+    Ensures tenant is resolved, uses the request's sync session, and includes all required headers.
 
     Args:
         client: httpx client (with TenantDirectTransport)
@@ -314,24 +415,10 @@ async def call_put(
         httpx.HTTPStatusError: If request fails
         AuthorizationError: If Authorization header missing or tenant resolution fails
     """
-    # Ensure tenant is resolved (single-tenant mode or dynamic resolution)
-    await ensure_tenant_resolved(client)
+    extra_headers = {"If-Match": str(if_match)} if if_match is not None else None
 
-    auth_header = await get_backend_auth_header(client)
-    session_headers = await ensure_session(client, auth_header)
-
-    headers = {
-        "Authorization": auth_header,
-        **session_headers,
-    }
-
-    if if_match is not None:
-        headers["If-Match"] = str(if_match)
-
-    logger.debug(f"PUT {path} if_match={if_match}")
-    response = await client.put(path, json=json, headers=headers)
-    response.raise_for_status()
-    return response
+    logger.debug("PUT {} if_match={}", path, if_match)
+    return await _send(client, "PUT", path, extra_headers=extra_headers, json=json)
 
 
 async def call_patch(
@@ -342,7 +429,7 @@ async def call_patch(
     """
     Make PATCH request to Go API.
 
-    Ensures tenant is resolved, creates a fresh sync session, and includes all required headers.
+    Ensures tenant is resolved, uses the request's sync session, and includes all required headers.
 
     Args:
         client: httpx client (with TenantDirectTransport)
@@ -356,21 +443,8 @@ async def call_patch(
         httpx.HTTPStatusError: If request fails
         AuthorizationError: If Authorization header missing or tenant resolution fails
     """
-    # Ensure tenant is resolved (single-tenant mode or dynamic resolution)
-    await ensure_tenant_resolved(client)
-
-    auth_header = await get_backend_auth_header(client)
-    session_headers = await ensure_session(client, auth_header)
-
-    headers = {
-        "Authorization": auth_header,
-        **session_headers,
-    }
-
-    logger.debug(f"PATCH {path}")
-    response = await client.patch(path, json=json, headers=headers)
-    response.raise_for_status()
-    return response
+    logger.debug("PATCH {}", path)
+    return await _send(client, "PATCH", path, json=json)
 
 
 async def call_delete(
@@ -380,7 +454,7 @@ async def call_delete(
     """
     Make DELETE request to Go API.
 
-    Ensures tenant is resolved, creates a fresh sync session, and includes all required headers.
+    Ensures tenant is resolved, uses the request's sync session, and includes all required headers.
 
     Args:
         client: httpx client (with TenantDirectTransport)
@@ -393,18 +467,5 @@ async def call_delete(
         httpx.HTTPStatusError: If request fails
         AuthorizationError: If Authorization header missing or tenant resolution fails
     """
-    # Ensure tenant is resolved (single-tenant mode or dynamic resolution)
-    await ensure_tenant_resolved(client)
-
-    auth_header = await get_backend_auth_header(client)
-    session_headers = await ensure_session(client, auth_header)
-
-    headers = {
-        "Authorization": auth_header,
-        **session_headers,
-    }
-
-    logger.debug(f"DELETE {path}")
-    response = await client.delete(path, headers=headers)
-    response.raise_for_status()
-    return response
+    logger.debug("DELETE {}", path)
+    return await _send(client, "DELETE", path)
@@ -1,17 +1,18 @@
 """
 Session management for MCP tool requests with per-user authentication.
 
-Each MCP tool invocation creates a new sync session with the Go API.
-This session-per-request approach is simple and doesn't require cleanup.
+Sync sessions are cached per user and reused across MCP tool invocations
+until shortly before the Go API expires them (30 minutes). Callers that get
+a stale-session response (expired session or epoch mismatch) call
+invalidate_session so the next create_session starts a fresh one.
 
 Path B OAuth 2.1: Backend JWT contains per-user identity (sub claim),
 so the Go API automatically creates sessions for the correct user.
-
-Note: Sessions are NOT cached or reused. Every call to create_session
-creates a fresh session to avoid stale session issues when sessions expire.
 """
 
-from typing import Dict
+import time
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 import httpx
 from loguru import logger
@@ -25,14 +26,55 @@ class SessionError(Exception):
     pass
 
 
+# Go API sessions expire after 30 minutes; drop cached ones well before that
+SESSION_TTL_SECONDS = 25 * 60
+
+# Upper bound on cached sessions so users who never come back can't grow the cache
+SESSION_CACHE_MAXSIZE = 4096
+
+# Per-user sync session cache: key is the AuthKit-validated user_id (MCP token sub),
+# value is (session headers, expiry)
+# Expiry uses time.monotonic() so wall-clock changes can't extend a session.
+# Headers are stored as read-only mappings: the same object is handed to every
+# request for the user, so a caller mutating it would leak into other requests.
+_session_cache: Dict[str, Tuple[Mapping[str, str], float]] = {}
+
+
+def _store_session(user_id: str, session_headers: Mapping[str, str]) -> None:
+    """
+    Cache a user's session, pruning expired entries first.
+
+    Inserts happen about once per user per SESSION_TTL_SECONDS, so a full scan
+    here is cheap. If the cache is still full after pruning, the oldest
+    entries (dicts keep insertion order) are evicted.
+    """
+    now = time.monotonic()
+    for key in [key for key, (_, expires_at) in _session_cache.items() if expires_at <= now]:
+        del _session_cache[key]
+
+    # Re-inserting moves the user to the end, keeping the dict oldest-first
+    _session_cache.pop(user_id, None)
+    while len(_session_cache) >= SESSION_CACHE_MAXSIZE:
+        del _session_cache[next(iter(_session_cache))]
+
+    _session_cache[user_id] = (session_headers, now + SESSION_TTL_SECONDS)
+
+
+def invalidate_session(user_id: str) -> None:
+    """Drop the cached sync session for a user so the next request creates one."""
+    if _session_cache.pop(user_id, None) is not None:
+        logger.debug(f"Invalidated cached sync session for user: {user_id}")
+
+
 async def create_session(
     client: httpx.AsyncClient, auth_header: str, user_id: str
-) -> Dict[str, str]:
+) -> Mapping[str, str]:
     """
-    Create a new sync session with the Go API.
+    Get a sync session with the Go API, creating one if needed.
 
-    This always creates a fresh session - no caching or reuse.
-    This ensures MCP tools can recover from session expiration.
+    Reuses the user's cached session while it is within SESSION_TTL_SECONDS;
+    otherwise POSTs /v1/sync/sessions and caches the result. Tokens whose user
+    could not be identified ("unknown") always get a fresh, uncached session.
 
     Path B OAuth 2.1: The backend JWT (auth_header) contains the user's
     identity (sub claim), so the Go API automatically creates a session
@@ -41,17 +83,26 @@ async def create_session(
     Args:
         client: httpx client (with TenantDirectTransport)
         auth_header: Backend JWT Authorization header (e.g., "Bearer eyJ...")
-        user_id: User ID for logging purposes (extracted from backend JWT)
+        user_id: AuthKit-validated user ID (MCP token sub claim); keys the
+            session cache
 
     Returns:
-        Dict with session headers: {"X-Sync-Session": "...", "X-Sync-Epoch": "..."}
+        Read-only mapping with session headers:
+        {"X-Sync-Session": "...", "X-Sync-Epoch": "..."}
 
     Raises:
         SessionError: If session creation fails
         httpx.HTTPStatusError: If request fails
     """
+    cacheable = user_id != "unknown"
+    if cacheable:
+        cached = _session_cache.get(user_id)
+        if cached is not None and cached[1] > time.monotonic():
+            logger.debug("Reusing cached sync session for user: {}", user_id)
+            return cached[0]
+
     try:
-        logger.debug(f"Creating fresh sync session for user: {user_id}")
+        logger.debug("Creating fresh sync session for user: {}", user_id)
 
         # The backend JWT contains the user identity (sub claim)
         # Go API JWT middleware will extract it automatically
@@ -64,16 +115,15 @@ async def create_session(
         response.raise_for_status()
 
         data = response.json()
-        session_id = data["id"]
-        session_epoch = data["epoch"]
-
-        session_headers = {
-            "X-Sync-Session": session_id,
-            "X-Sync-Epoch": str(session_epoch),
-        }
+        session_headers = MappingProxyType({
+            "X-Sync-Session": data["id"],
+            "X-Sync-Epoch": str(data["epoch"]),
+        })
 
-        logger.debug(f"✓ Session created: {session_id} (epoch={session_epoch})")
+        logger.debug("✓ Session created: {} (epoch={})", data["id"], data["epoch"])
 
+        if cacheable:
+            _store_session(user_id, session_headers)
         return session_headers
 
     except httpx.HTTPStatusError as e:
@@ -8,42 +8,90 @@ This script:
 3. Verifies session creation and usage
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import itertools
+import logging
 import sys
 import json
 import time
-from datetime import datetime, timedelta
+import traceback
 
 import httpx
-import jwt
-from loguru import logger
+
+# uvloop ships with uvicorn[standard]; fall back to the stock loop when it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Configure logging
-logger.remove()
-logger.add(sys.stderr, level="INFO", format="<level>{message}</level>", colorize=True)
+logging.basicConfig(stream=sys.stderr, level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("mcp-test")
+# log_response already reports every request; silence httpx's own INFO line
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Configuration
 MCP_URL = "http://localhost:8001"
 JWT_SECRET = "dev-secret"
+JWT_KEY = JWT_SECRET.encode()
 USER_ID = f"mcp-test-{int(time.time())}"
 
 
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS256 header and keyed HMAC never change, so encode/key them once
+JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+JWT_HMAC = hmac.new(JWT_KEY, digestmod=hashlib.sha256)
+
+# Every tool call shares the same JSON-RPC 2.0 envelope; only id and params vary
+_RPC_TEMPLATE = {"jsonrpc": "2.0", "id": 0, "method": "tools/call", "params": None}
+_rpc_ids = itertools.count(1)
+
+
 def generate_jwt_token(user_id: str, tenant_id: str = "test-tenant-123") -> str:
     """Generate a development JWT token."""
+    now = int(time.time())
     payload = {
         "sub": user_id,
         "tenant_id": tenant_id,
-        "iat": datetime.utcnow(),
-        "exp": datetime.utcnow() + timedelta(hours=1),
+        "iat": now,
+        "exp": now + 3600,  # 1 hour
     }
-    token = jwt.encode(payload, JWT_SECRET, algorithm="HS256")
-    return token
+    payload_b64 = _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    signing_input = JWT_HEADER_B64 + b"." + payload_b64
+    mac = JWT_HMAC.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode()
+
 
+async def log_request(request: httpx.Request) -> None:
+    """Stamp outgoing requests so log_response can report their duration."""
+    request.extensions["started_at"] = time.perf_counter()
 
-async def call_mcp_tool(tool_name: str, arguments: dict, auth_token: str) -> dict:
+
+async def log_response(response: httpx.Response) -> None:
+    """Log each MCP round trip once, at the client boundary."""
+    request = response.request
+    elapsed_ms = (time.perf_counter() - request.extensions["started_at"]) * 1000
+    logger.info(
+        "%s %s -> %d (%.0f ms)",
+        request.method, request.url.path, response.status_code, elapsed_ms,
+    )
+
+
+async def call_mcp_tool(
+    client: httpx.AsyncClient, tool_name: str, arguments: dict, auth_token: str
+) -> dict:
     """
     Call an MCP tool via JSON-RPC.
 
     Args:
+        client: Shared httpx client (keeps the MCP connection alive between calls)
         tool_name: Name of the tool to call
         arguments: Tool arguments
         auth_token: JWT bearer token
@@ -51,91 +99,65 @@ async def call_mcp_tool(tool_name: str, arguments: dict, auth_token: str) -> dic
     Returns:
         Tool result
     """
-    async with httpx.AsyncClient() as client:
-        # MCP uses JSON-RPC 2.0 protocol
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments,
-            }
-        }
-
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {auth_token}",
-        }
-
-        logger.info(f"Calling MCP tool: {tool_name}")
-        logger.debug(f"Arguments: {arguments}")
-
-        response = await client.post(
-            f"{MCP_URL}/mcp/v1/",  # FastMCP endpoint
-            json=request_data,
-            headers=headers,
-            timeout=30.0,
-        )
+    # MCP uses JSON-RPC 2.0 protocol; unique ids keep concurrent calls distinguishable
+    request_data = _RPC_TEMPLATE.copy()
+    request_data["id"] = next(_rpc_ids)
+    request_data["params"] = {"name": tool_name, "arguments": arguments}
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {auth_token}",
+    }
+
+    response = await client.post(
+        "/mcp/v1/",  # FastMCP endpoint
+        json=request_data,
+        headers=headers,
+    )
 
-        response.raise_for_status()
-        result = response.json()
+    response.raise_for_status()
+    result = response.json()
 
-        if "error" in result:
-            logger.error(f"MCP error: {result['error']}")
-            raise Exception(f"MCP error: {result['error']}")
+    if "error" in result:
+        logger.error("MCP error: %s", result["error"])
+        raise Exception(f"MCP error: {result['error']}")
 
-        return result.get("result", {})
+    return result.get("result", {})
 
 
-async def test_create_note():
+async def test_create_note(client: httpx.AsyncClient, token: str):
     """Test creating a note via MCP (verifies session management)."""
     logger.info("━━━ Test: Create Note via MCP ━━━")
 
-    # Generate JWT token
-    token = generate_jwt_token(USER_ID)
-    logger.success(f"✓ Generated JWT for user: {USER_ID}")
-
-    # Call create_note tool
-    try:
-        result = await call_mcp_tool(
-            "create_note",
-            {
-                "title": "MCP Integration Test Note",
-                "content": "Created via MCP Inspector test",
-                "tags": ["mcp", "e2e", "session-management"],
-            },
-            token,
-        )
-
-        logger.success(f"✓ Note created: {result}")
-        return result
+    result = await call_mcp_tool(
+        client,
+        "create_note",
+        {
+            "title": "MCP Integration Test Note",
+            "content": "Created via MCP Inspector test",
+            "tags": ["mcp", "e2e", "session-management"],
+        },
+        token,
+    )
 
-    except Exception as e:
-        logger.error(f"✗ Failed to create note: {e}")
-        raise
+    logger.info("✓ Note created: %s", result)
+    return result
 
 
-async def test_list_notes():
+async def test_list_notes(client: httpx.AsyncClient, token: str):
     """Test listing notes via MCP."""
     logger.info("")
     logger.info("━━━ Test: List Notes via MCP ━━━")
 
-    token = generate_jwt_token(USER_ID)
+    result = await call_mcp_tool(
+        client,
+        "list_notes",
+        {"limit": 5},
+        token,
+    )
 
-    try:
-        result = await call_mcp_tool(
-            "list_notes",
-            {"limit": 5},
-            token,
-        )
-
-        logger.success(f"✓ Listed notes: {len(result.get('notes', []))} notes")
-        return result
-
-    except Exception as e:
-        logger.error(f"✗ Failed to list notes: {e}")
-        raise
+    logger.info("✓ Listed notes: %d notes", len(result.get("notes", [])))
+    return result
 
 
 async def main():
@@ -145,8 +167,8 @@ async def main():
     logger.info("╚══════════════════════════════════════════════════════════════╝")
     logger.info("")
     logger.info("Configuration:")
-    logger.info(f"  MCP Service:  {MCP_URL}")
-    logger.info(f"  User ID:      {USER_ID}")
+    logger.info("  MCP Service:  %s", MCP_URL)
+    logger.info("  User ID:      %s", USER_ID)
     logger.info("")
 
     tests = [
@@ -154,17 +176,38 @@ async def main():
         ("List Notes", test_list_notes),
     ]
 
-    results = []
+    # One token for the whole run - it stays valid for an hour
+    token = generate_jwt_token(USER_ID)
+    logger.info("✓ Generated JWT for user: %s", USER_ID)
+    logger.info("")
+
+    # One client for the whole run so every tool call reuses the same pooled connection.
+    # The tests are independent, so run them concurrently.
+    async with httpx.AsyncClient(
+        base_url=MCP_URL,
+        timeout=30.0,
+        event_hooks={"request": [log_request], "response": [log_response]},
+    ) as client:
+        outcomes = await asyncio.gather(
+            *(test_func(client, token) for _, test_func in tests),
+            return_exceptions=True,
+        )
+
+    # Tests just raise on failure; collect every outcome here and report failures once
+    results = [
+        (name, not isinstance(outcome, BaseException))
+        for (name, _), outcome in zip(tests, outcomes)
+    ]
+    failures = [
+        (name, outcome)
+        for (name, _), outcome in zip(tests, outcomes)
+        if isinstance(outcome, BaseException)
+    ]
 
-    for name, test_func in tests:
-        try:
-            await test_func()
-            results.append((name, True))
-        except Exception as e:
-            logger.error(f"✗ {name} FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+    for name, error in failures:
+        logger.error("")
+        logger.error("✗ %s FAILED: %s", name, error)
+        traceback.print_exception(error)
 
     # Summary
     logger.info("")
@@ -177,13 +220,13 @@ async def main():
 
     for name, result in results:
         status = "✓ PASS" if result else "✗ FAIL"
-        logger.info(f"  {status:>8} {name}")
+        logger.info("  %8s %s", status, name)
 
     logger.info("")
-    logger.info(f"Results: {passed}/{total} tests passed")
+    logger.info("Results: %d/%d tests passed", passed, total)
 
     if passed == total:
-        logger.success("━━━ All MCP Tool Tests PASSED! ━━━")
+        logger.info("━━━ All MCP Tool Tests PASSED! ━━━")
         logger.info("")
         logger.info("Validated:")
         logger.info("  ✓ MCP tools can be called via JSON-RPC")
@@ -198,5 +241,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    sys.exit(asyncio.run(main()))
+    run = uvloop.run if uvloop is not None else asyncio.run
+    sys.exit(run(main()))